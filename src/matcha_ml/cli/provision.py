@@ -16,9 +16,6 @@ from matcha_ml.runners import AzureRunner
 from matcha_ml.state import RemoteStateManager
 from matcha_ml.templates import AzureTemplate
 
-# create a typer app to group all provision subcommands
-app = typer.Typer()
-
 
 def fill_provision_variables(
     location: str,
@@ -1,6 +1,7 @@
 """Global parameter service for creating and modifying a users global config files."""
+import functools
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import uuid4
 
 import yaml
@@ -8,6 +9,10 @@ import yaml
 from matcha_ml.errors import MatchaError, MatchaPermissionError
 from matcha_ml.services._validation import _check_uuid
 
+# Use the libyaml based loader and dumper when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class GlobalParameters:
     """A Global parameters service for interacting and updating a users global config file.
@@ -18,6 +23,8 @@ class GlobalParameters:
     _instance: Optional["GlobalParameters"] = None
     _user_id: Optional[str] = None
     _analytics_opt_out: bool = False
+    # The config file (modification time in nanoseconds, size) and its parsed contents
+    _config_cache: Optional[Tuple[Tuple[int, int], Any]] = None
 
     def __new__(cls) -> "GlobalParameters":
         """Creates a singleton instance of the GlobalParameters class.
@@ -41,8 +48,7 @@ class GlobalParameters:
         Raises:
             MatchaError: Raised when the user_id uuid is an invalid uuid.
         """
-        with open(self.default_config_file_path) as file:
-            yaml_data = yaml.safe_load(file)
+        yaml_data = self._load_global_config()
 
         try:
             _check_uuid(yaml_data.get("user_id"))
@@ -69,8 +75,7 @@ class GlobalParameters:
             )
 
         # Create config file and populate with the current class variables
-        with open(self.default_config_file_path, "w") as file:
-            yaml.dump(data, file)
+        self._write_global_config(data)
 
     def _update_global_config(self) -> None:
         """Updates an existing config file with the global parameters."""
@@ -79,8 +84,42 @@ class GlobalParameters:
             "analytics_opt_out": self.analytics_opt_out,
         }
 
+        self._write_global_config(data)
+
+    def _config_file_signature(self) -> Tuple[int, int]:
+        """Get the values used to detect changes to the config file.
+
+        Returns:
+            Tuple[int, int]: the modification time in nanoseconds and the size of the config file.
+        """
+        stat = os.stat(self.default_config_file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_global_config(self) -> Any:
+        """Loads the config yaml file, only parsing it again when it has been modified.
+
+        Returns:
+            Any: the parsed contents of the config file.
+        """
+        signature = self._config_file_signature()
+
+        if self._config_cache is None or self._config_cache[0] != signature:
+            with open(self.default_config_file_path) as file:
+                yaml_data = yaml.load(file, Loader=_YAML_LOADER)
+            self._config_cache = (signature, yaml_data)
+
+        return self._config_cache[1]
+
+    def _write_global_config(self, data: Dict[str, Any]) -> None:
+        """Writes the config yaml file and updates the cached contents to match.
+
+        Args:
+            data (Dict[str, Any]): the global parameters to write.
+        """
         with open(self.default_config_file_path, "w") as file:
-            yaml.dump(data, file)
+            yaml.dump(data, file, Dumper=_YAML_DUMPER, default_flow_style=False)
+
+        self._config_cache = (self._config_file_signature(), dict(data))
 
     @property
     def user_id(self) -> str:
@@ -112,10 +151,12 @@ class GlobalParameters:
         self._analytics_opt_out = value
         self._update_global_config()
 
-    @property
+    @functools.cached_property
     def default_config_file_path(self) -> str:
         """Path to the default configuration file containing the global parameters.
 
+        The path is resolved on first access and cached on the instance.
+
         Returns:
             The default global configuration directory.
         """
@@ -130,7 +171,4 @@ class GlobalParameters:
         Returns:
             Dict[str, Any]: the user config file in the format of a dictionary.
         """
-        with open(self.default_config_file_path) as f:
-            config_contents = dict(yaml.safe_load(f))
-
-        return config_contents
+        return dict(self._load_global_config())
@@ -0,0 +1,127 @@
+"""File copy functions shared by the templates."""
+import os
+from typing import Callable
+
+# Size of the buffer used when a kernel-side file copy is unavailable.
+COPY_BUFFER_SIZE = 1 << 20
+
+_copy_buffer = bytearray(COPY_BUFFER_SIZE)
+
+
+def _kernel_copy(copy_chunk: Callable[[int, int], int], copied: int, size: int) -> int:
+    """Copy with a kernel-side copy function until it is done, fails or stops short.
+
+    Args:
+        copy_chunk (Callable[[int, int], int]): copies up to count bytes from an offset, returning the number copied.
+        copied (int): number of bytes already copied.
+        size (int): total number of bytes to copy.
+
+    Returns:
+        int: the number of bytes copied so far.
+    """
+    try:
+        while copied < size:
+            n = copy_chunk(copied, size - copied)
+            if not n:
+                break
+            copied += n
+    except OSError:
+        pass
+    return copied
+
+
+def _copy_fd(in_fd: int, out_fd: int, size: int) -> None:
+    """Copy size bytes between two open file descriptors.
+
+    The kernel-side copy_file_range is tried first, followed by sendfile, with a
+    user-space copy through a reusable buffer as the final fallback. A
+    strategy that fails or stops short (some filesystems report no bytes copied)
+    hands over to the next one from the offset it reached.
+
+    Args:
+        in_fd (int): file descriptor to read from.
+        out_fd (int): file descriptor to write to.
+        size (int): number of bytes to copy.
+
+    Raises:
+        OSError: if fewer than size bytes could be copied.
+    """
+    copied = 0
+
+    if hasattr(os, "copy_file_range"):
+        copied = _kernel_copy(
+            lambda offset, count: os.copy_file_range(
+                in_fd, out_fd, count, offset, offset
+            ),
+            copied,
+            size,
+        )
+        if copied == size:
+            return
+
+    if hasattr(os, "sendfile"):
+        os.lseek(out_fd, copied, os.SEEK_SET)
+        copied = _kernel_copy(
+            lambda offset, count: os.sendfile(out_fd, in_fd, offset, count),
+            copied,
+            size,
+        )
+        if copied == size:
+            return
+
+    os.lseek(in_fd, copied, os.SEEK_SET)
+    os.lseek(out_fd, copied, os.SEEK_SET)
+    view = memoryview(_copy_buffer)
+    with open(in_fd, "rb", buffering=0, closefd=False) as src, open(
+        out_fd, "wb", buffering=0, closefd=False
+    ) as dst:
+        while copied < size:
+            read = src.readinto(_copy_buffer)
+            if not read:
+                break
+            dst.write(view[:read])
+            copied += read
+
+    if copied < size:
+        raise OSError(f"Only {copied} of {size} bytes could be copied.")
+
+
+def _fast_copy(source_path: str, destination_path: str) -> None:
+    """Copy the contents of a file, overwriting the destination if it exists.
+
+    The destination is given the timestamps of the source, so a destination which already
+    has the same size and modification time as the source is treated as unchanged and skipped.
+    Permissions are not copied as they are not required for templates.
+
+    Args:
+        source_path (str): path of the file to copy.
+        destination_path (str): path to write the copy to.
+    """
+    source_stat = os.stat(source_path)
+    try:
+        destination_stat = os.stat(destination_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            source_stat.st_size == destination_stat.st_size
+            and source_stat.st_mtime_ns == destination_stat.st_mtime_ns
+        ):
+            return
+
+    binary_flag = getattr(os, "O_BINARY", 0)
+    in_fd = os.open(source_path, os.O_RDONLY | binary_flag)
+    try:
+        out_fd = os.open(
+            destination_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary_flag,
+            0o644,
+        )
+        try:
+            _copy_fd(in_fd, out_fd, source_stat.st_size)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+    os.utime(destination_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
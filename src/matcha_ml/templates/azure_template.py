@@ -1,9 +1,12 @@
 """Build a template for provisioning resources on Azure using terraform files."""
-import json
 import os
 from typing import Optional
 
-from matcha_ml.templates.base_template import BaseTemplate, TemplateVariables
+from matcha_ml.templates.base_template import (
+    BaseTemplate,
+    TemplateVariables,
+    _write_json,
+)
 
 SUBMODULE_NAMES = [
     "aks",
@@ -58,5 +61,4 @@ class AzureTemplate(BaseTemplate):
         _ = config_dict.pop("password", None)
         initial_state_file_dict = {"cloud": config_dict}
 
-        with open(state_file_destination, "w") as f:
-            json.dump(initial_state_file_dict, f)
+        _write_json(state_file_destination, initial_state_file_dict)
@@ -1,10 +1,19 @@
 """Base template that serves as a foundation for other templates to inherit from."""
 import dataclasses
-import glob
 import json
 import os
-from shutil import copy, rmtree
-from typing import List, Optional
+from shutil import rmtree
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from matcha_ml.cli.ui.print_messages import print_status
 from matcha_ml.cli.ui.status_message_builders import (
@@ -13,11 +22,136 @@ from matcha_ml.cli.ui.status_message_builders import (
     build_substep_success_status,
 )
 from matcha_ml.errors import MatchaPermissionError
+from matcha_ml.templates._copy import _fast_copy
+
+
+def _has_extension(filename: str, extensions: FrozenSet[str]) -> bool:
+    """Check whether a filename ends with a "." followed by one of the given extensions.
+
+    Args:
+        filename (str): name of the file to check.
+        extensions (FrozenSet[str]): allowed file extensions, without the leading dot.
+
+    Returns:
+        bool: True when the file has one of the extensions.
+    """
+    _, separator, extension = filename.rpartition(".")
+    return bool(separator) and extension in extensions
+
+
+def _scan_files(directory: str, extensions: FrozenSet[str]) -> List["os.DirEntry[str]"]:
+    """List the files in a directory which have one of the given extensions.
+
+    Hidden files are skipped, matching the behaviour of glob.
+
+    Args:
+        directory (str): path of the directory to scan.
+        extensions (FrozenSet[str]): allowed file extensions, without the leading dot.
+
+    Returns:
+        List[os.DirEntry[str]]: the matching directory entries, empty if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [
+                entry
+                for entry in it
+                if not entry.name.startswith(".")
+                and _has_extension(entry.name, extensions)
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _copy_all(copies: Sequence[Tuple[str, str]]) -> List[str]:
+    """Copy each source file to its destination.
+
+    Args:
+        copies (Sequence[Tuple[str, str]]): pairs of source and destination paths.
+
+    Returns:
+        List[str]: the paths of the copied files in the destination.
+    """
+    for source_path, destination_path in copies:
+        _fast_copy(source_path, destination_path)
+
+    return [destination_path for _, destination_path in copies]
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """Write data to a JSON file with a single write call.
+
+    json.dumps escapes non-ASCII characters by default, so the file is always ASCII.
+
+    Args:
+        path (str): path of the file to write.
+        data (Dict[str, Any]): JSON serialisable data to write.
+    """
+    with open(path, "w", buffering=1 << 16, encoding="ascii") as f:
+        f.write(json.dumps(data))
+
+
+def _leaf_directories(directory_names: Sequence[str]) -> List[str]:
+    """Remove directories which are a parent of another directory in the sequence.
+
+    Args:
+        directory_names (Sequence[str]): "/" separated relative directory paths.
+
+    Returns:
+        List[str]: the unique directory paths which have no nested directory in the sequence.
+    """
+    unique_names = sorted(set(directory_names), key=lambda name: name.count("/"))
+    return [
+        name
+        for i, name in enumerate(unique_names)
+        if not any(other.startswith(f"{name}/") for other in unique_names[i + 1 :])
+    ]
+
+
+def _remove_stale_files(destination: str, keep: Iterable[str]) -> None:
+    """Remove everything in the destination that is not being kept.
+
+    Directories that are kept, or that contain a kept path, are cleaned out; any other
+    directory is removed entirely. Symbolic links are removed without being followed.
+
+    Args:
+        destination (str): root directory to clean up, which is never removed itself.
+        keep (Iterable[str]): paths of the files and directories to keep.
+    """
+    # Compare paths relative to the destination so that any spelling of it matches
+    keep_paths = {os.path.relpath(path, destination) for path in keep}
+
+    keep_directories = set(keep_paths)
+    for path in keep_paths:
+        parent = os.path.dirname(path)
+        while parent:
+            keep_directories.add(parent)
+            parent = os.path.dirname(parent)
+
+    directories = [""]
+    while directories:
+        directory = directories.pop()
+        with os.scandir(os.path.join(destination, directory)) as it:
+            entries = list(it)
+
+        for entry in entries:
+            path = os.path.join(directory, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if path in keep_directories:
+                    directories.append(path)
+                else:
+                    rmtree(entry.path)
+            elif path not in keep_paths:
+                os.remove(entry.path)
 
 
 @dataclasses.dataclass
 class TemplateVariables:
-    """Terraform template variables."""
+    """Terraform template variables.
+
+    Variables are serialised directly from the instance __dict__, so only JSON primitive values are supported.
+    """
 
     def __init__(self, **kwargs: str):
         """A constructor that accepts an arbitrary number of named arguments and sets them as class variables."""
@@ -28,13 +162,12 @@ class BaseTemplate:
     """An abstract base class that serves as the foundation for other template classes."""
 
     # Define additional non-tf files that are needed from the main module
-    main_module_filenames: List[str] = [
-        ".gitignore",
-        ".terraform.lock.hcl",
-    ]
+    main_module_filenames: FrozenSet[str] = frozenset(
+        {".gitignore", ".terraform.lock.hcl"}
+    )
 
-    # A list of allowed file extensions.
-    allowed_extensions: List[str] = ["tf", "yaml", "tpl"]
+    # A set of allowed file extensions.
+    allowed_extensions: FrozenSet[str] = frozenset({"tf", "yaml", "tpl"})
 
     def __init__(self, submodule_names: List[str]):
         """Initialize the class.
@@ -44,6 +177,11 @@ class BaseTemplate:
         """
         self.submodule_names = submodule_names
 
+        # Precompute the submodule directories that need to be created
+        self._submodule_leaf_names: Tuple[str, ...] = tuple(
+            _leaf_directories(submodule_names)
+        )
+
     def build_template_configuration(self, **kwargs: str) -> TemplateVariables:
         """Ask for variables and build the configuration.
 
@@ -56,14 +194,20 @@ class BaseTemplate:
         return TemplateVariables(**kwargs)
 
     def copy_files(
-        self, files: List[str], destination: str, sub_folder_path: str = ""
-    ) -> None:
+        self,
+        files: Sequence[Union[str, "os.DirEntry[str]"]],
+        destination: str,
+        sub_folder_path: str = "",
+    ) -> List[str]:
         """Copy files from folders and sub folders to the destination directory.
 
         Args:
-            files (List[str]): List of all allowed file paths in the folder/sub-folder to copy to destination.
+            files (Sequence[Union[str, os.DirEntry[str]]]): All allowed file paths or directory entries in the folder/sub-folder to copy to destination.
             destination (str): destination path to write template to.
             sub_folder_path (str): Path to sub folder to create in destination. Defaults to "".
+
+        Returns:
+            List[str]: the paths of the copied files in the destination.
         """
         destination_folder = (
             os.path.join(destination, sub_folder_path)
@@ -71,63 +215,90 @@ class BaseTemplate:
             else destination
         )
 
-        for source_path in files:
-            filename = os.path.basename(source_path)
-            destination_path = os.path.join(destination_folder, filename)
-            copy(source_path, destination_path)
+        # A trailing separator lets each destination path be built by concatenation
+        destination_prefix = os.path.join(destination_folder, "")
 
-    def copy_main_module_files(self, template_src: str, destination: str) -> None:
+        copies = []
+        for file in files:
+            source_path = os.fspath(file)
+            copies.append(
+                (source_path, destination_prefix + os.path.basename(source_path))
+            )
+
+        return _copy_all(copies)
+
+    def copy_main_module_files(self, template_src: str, destination: str) -> List[str]:
         """Copy main module files from the template source to the destination.
 
         Args:
             template_src (str): Path of the template source directory.
             destination (str): Destination path to copy the files to.
+
+        Returns:
+            List[str]: the paths of the copied files in the destination.
         """
         files = [
             os.path.join(template_src, filename)
             for filename in self.main_module_filenames
         ]
-        self.copy_files(files, destination)
+        return self.copy_files(files, destination)
 
     def copy_submodule_files(
         self, template_src: str, destination: str, verbose: Optional[bool]
-    ) -> None:
+    ) -> List[str]:
         """Copy submodule files from the template source to the destination.
 
         Args:
             template_src (str): Path of the template source directory.
             destination (str): Destination path to copy the files to.
             verbose (Optional[bool]): Additional output is shown when True.
+
+        Returns:
+            List[str]: the paths of the copied files in the destination.
         """
+        # Parent directories are created along with their nested submodules
+        for leaf_name in self._submodule_leaf_names:
+            os.makedirs(os.path.join(destination, leaf_name), exist_ok=True)
+
+        copied_paths = []
         for submodule_name in self.submodule_names:
-            submodule_destination = os.path.join(destination, submodule_name)
-            os.makedirs(submodule_destination, exist_ok=True)
+            files = _scan_files(
+                os.path.join(template_src, submodule_name), self.allowed_extensions
+            )
+            copied_paths.extend(self.copy_files(files, destination, submodule_name))
 
-            for ext in self.allowed_extensions:
-                file_pattern = os.path.join(template_src, submodule_name, f"*.{ext}")
-                files = glob.glob(file_pattern)
+        if verbose:
+            self._print_submodules_copied()
 
-                self.copy_files(files, destination, submodule_name)
+        return copied_paths
 
-            if verbose:
-                print_status(
-                    build_substep_success_status(
-                        f"{submodule_name} module configuration was copied"
-                    )
+    def _print_submodules_copied(self) -> None:
+        """Print a status message for each copied submodule in a single print call."""
+        print_status(
+            "\n".join(
+                build_substep_success_status(
+                    f"{submodule_name} module configuration was copied"
                 )
+                for submodule_name in self.submodule_names
+            )
+        )
 
     def copy_files_with_extension(
         self, template_src: str, extension: str, destination: str
-    ) -> None:
+    ) -> List[str]:
         """Copy files with the specified extension from the template source to the destination.
 
         Args:
             template_src (str): Path of the template source directory.
-            extension (str): File extension to filter files.
+            extension (str): File extension pattern to filter files, e.g. "*.tf".
             destination (str): Destination path to copy the files to.
+
+        Returns:
+            List[str]: the paths of the copied files in the destination.
         """
-        files = glob.glob(os.path.join(template_src, extension))
-        self.copy_files(files, destination)
+        _, _, extension_name = extension.rpartition(".")
+        files = _scan_files(template_src, frozenset({extension_name}))
+        return self.copy_files(files, destination)
 
     def build_template(
         self,
@@ -150,10 +321,6 @@ class BaseTemplate:
         try:
             print_status(build_status("\nBuilding configuration template..."))
 
-            # Override configuration if it already exists
-            if os.path.exists(destination):
-                rmtree(destination)
-
             os.makedirs(destination, exist_ok=True)
 
             if verbose:
@@ -163,9 +330,12 @@ class BaseTemplate:
                     )
                 )
 
-            self.copy_main_module_files(template_src, destination)
-            self.copy_submodule_files(template_src, destination, verbose)
-            self.copy_files_with_extension(template_src, "*.tf", destination)
+            # Existing files are overwritten in place, anything else is removed below
+            copied_paths = [
+                *self.copy_main_module_files(template_src, destination),
+                *self.copy_submodule_files(template_src, destination, verbose),
+                *self.copy_files_with_extension(template_src, "*.tf", destination),
+            ]
 
             if verbose:
                 print_status(
@@ -175,14 +345,23 @@ class BaseTemplate:
             configuration_destination = os.path.join(
                 destination, "terraform.tfvars.json"
             )
-            with open(configuration_destination, "w") as f:
-                json.dump(vars(config), f)
+            _write_json(configuration_destination, vars(config))
 
             if verbose:
                 print_status(
                     build_substep_success_status("Template variables were added.")
                 )
 
+            # Override any configuration left over from a previous build
+            _remove_stale_files(
+                destination,
+                [
+                    *copied_paths,
+                    configuration_destination,
+                    *(os.path.join(destination, name) for name in self.submodule_names),
+                ],
+            )
+
         except PermissionError:
             raise MatchaPermissionError(
                 f"Error - You do not have permission to write the configuration. Check if you have write permissions for '{destination}'."
@@ -7,7 +7,7 @@ import pytest
 import yaml
 
 from matcha_ml.errors import MatchaPermissionError
-from matcha_ml.services.global_parameters_service import GlobalParameters
+from matcha_ml.services.global_parameters_service import _YAML_DUMPER, GlobalParameters
 
 INTERNAL_FUNCTION_STUB = "matcha_ml.services.global_parameters_service.GlobalParameters"
 
@@ -85,7 +85,7 @@ def test_existing_config_file(config_path, uuid_for_testing):
 
     # Create config file and populate with the current class variables
     with open(config_path, "w") as file:
-        yaml.dump(data, file)
+        yaml.dump(data, file, Dumper=_YAML_DUMPER, default_flow_style=False)
 
     with mock.patch(
         f"{INTERNAL_FUNCTION_STUB}.default_config_file_path",
@@ -143,3 +143,65 @@ def test_config_file_write_permissions(matcha_testing_directory, config_path):
 
         with pytest.raises(MatchaPermissionError):
             _ = GlobalParameters()
+
+
+def test_default_config_file_path_is_cached(matcha_testing_directory):
+    """Tests that the default config file path is only resolved once per instance.
+
+    Args:
+        matcha_testing_directory (str): Mock testing directory.
+    """
+    with mock.patch(
+        "matcha_ml.services.global_parameters_service.os.path.expanduser",
+        return_value=matcha_testing_directory,
+    ) as expanduser:
+        config_instance = GlobalParameters()
+        first_path = config_instance.default_config_file_path
+        second_path = config_instance.default_config_file_path
+
+    assert first_path is second_path
+    assert first_path == os.path.join(
+        matcha_testing_directory, ".config", "matcha-ml", "config.yaml"
+    )
+    expanduser.assert_called_once_with("~")
+
+
+def test_config_file_is_only_parsed_when_modified(config_path, uuid_for_testing):
+    """Tests that the config file is cached until its modification time or size changes.
+
+    Args:
+        config_path (str): Mock testing directory location for the config file to be located
+        uuid_for_testing (uuid.UUID): a UUID which acts as a mock for the user_id
+    """
+    with mock.patch(
+        f"{INTERNAL_FUNCTION_STUB}.default_config_file_path",
+        new_callable=mock.PropertyMock,
+    ) as file_path:
+        file_path.return_value = config_path
+
+        config_instance = GlobalParameters()
+
+        with mock.patch(
+            "matcha_ml.services.global_parameters_service.yaml.load"
+        ) as yaml_load:
+            _ = config_instance.config_file
+            yaml_load.assert_not_called()
+
+        # A rewrite within the same timestamp tick is detected by the size change
+        config_stat = os.stat(config_path)
+        data = {"user_id": str(uuid_for_testing), "analytics_opt_out": True}
+        with open(config_path, "w") as file:
+            yaml.dump(data, file)
+        os.utime(config_path, ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns))
+
+        assert os.stat(config_path).st_size != config_stat.st_size
+        assert config_instance.config_file == data
+
+        # A rewrite which changes the modification time is also detected
+        data["analytics_opt_out"] = False
+        with open(config_path, "w") as file:
+            yaml.dump(data, file)
+        mtime_ns = config_stat.st_mtime_ns + 10**9
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+        assert config_instance.config_file == data
@@ -2,11 +2,16 @@
 import glob
 import json
 import os
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
+from unittest import mock
 
 import pytest
 
-from matcha_ml.templates.base_template import BaseTemplate, TemplateVariables
+from matcha_ml.templates.base_template import (
+    BaseTemplate,
+    TemplateVariables,
+    _leaf_directories,
+)
 
 SUBMODULE_NAMES = ["test_submodule_1", "test_submodule_2"]
 
@@ -139,6 +144,25 @@ def test_copy_main_module_files(
         assert os.path.exists(os.path.join(matcha_testing_directory, file))
 
 
+def test_copy_main_module_files_missing_file(
+    mock_infrastructure_directory: Tuple[str, str, str, str],
+    matcha_testing_directory: str,
+    base_template: BaseTemplate,
+):
+    """Test that copy_main_module_files raises an error when a main module file is missing from the template.
+
+    Args:
+        mock_infrastructure_directory (Tuple[str, str, str, str]): A tuple containing the paths to the infrastructure directory, main module directory, and submodule directories.
+        matcha_testing_directory (str): The path to the matcha testing directory.
+        base_template (BaseTemplate): The BaseTemplate object being tested.
+    """
+    _, template_src, _, _ = mock_infrastructure_directory
+    os.remove(os.path.join(template_src, ".terraform.lock.hcl"))
+
+    with pytest.raises(FileNotFoundError):
+        base_template.copy_main_module_files(template_src, matcha_testing_directory)
+
+
 def test_copy_submodule_files(
     mock_infrastructure_directory: Tuple[str, str, str, str],
     matcha_testing_directory: str,
@@ -215,3 +239,239 @@ def test_build_template(
     expected_tf_vars = {"location": "test-location", "prefix": "test-prefix"}
 
     assert_infrastructure(template_src_path, destination_path, expected_tf_vars)
+
+
+def test_copy_files_preserves_contents(
+    tmp_path: str, matcha_testing_directory: str, base_template: BaseTemplate
+):
+    """Test that copy_files writes an exact copy of the source file contents.
+
+    Args:
+        tmp_path (str): The temporary directory path provided by pytest.
+        matcha_testing_directory (str): The path to the matcha testing directory.
+        base_template (BaseTemplate): The BaseTemplate object being tested.
+    """
+    contents = os.urandom(3 * 1024 * 1024 + 7)
+    test_file_path = os.path.join(tmp_path, "test_file_1.tf")
+    with open(test_file_path, "wb") as f:
+        f.write(contents)
+
+    base_template.copy_files([test_file_path], matcha_testing_directory)
+
+    with open(os.path.join(matcha_testing_directory, "test_file_1.tf"), "rb") as f:
+        assert f.read() == contents
+
+
+def test_copy_submodule_files_filters_extensions(
+    mock_infrastructure_directory: Tuple[str, str, str, str],
+    matcha_testing_directory: str,
+):
+    """Test that only files with an allowed extension are copied and missing submodules are skipped.
+
+    Args:
+        mock_infrastructure_directory (Tuple[str, str, str, str]): A tuple containing the paths to the infrastructure directory, main module directory, and submodule directories.
+        matcha_testing_directory (str): The path to the matcha testing directory.
+    """
+    _, template_src, _, submodule_2_dir = mock_infrastructure_directory
+    for filename in ["README.md", "tf", "yaml"]:
+        with open(os.path.join(submodule_2_dir, filename), "w"):
+            ...
+
+    template = BaseTemplate([*SUBMODULE_NAMES, "missing_submodule"])
+    template.copy_submodule_files(template_src, matcha_testing_directory, False)
+
+    assert sorted(
+        os.listdir(os.path.join(matcha_testing_directory, "test_submodule_2"))
+    ) == ["test_file_2.yaml", "test_file_3.tpl"]
+    assert os.listdir(os.path.join(matcha_testing_directory, "missing_submodule")) == []
+
+
+@pytest.mark.parametrize(
+    "unavailable", [("copy_file_range",), ("copy_file_range", "sendfile")]
+)
+@pytest.mark.parametrize(
+    "failure", [{"side_effect": OSError}, {"return_value": 0}], ids=["error", "zero"]
+)
+def test_copy_files_fallback(
+    tmp_path: str,
+    matcha_testing_directory: str,
+    base_template: BaseTemplate,
+    unavailable: Tuple[str, ...],
+    failure: Dict[str, Any],
+):
+    """Test that copy_files falls back to a slower copy when a kernel-side copy fails or copies nothing.
+
+    Args:
+        tmp_path (str): The temporary directory path provided by pytest.
+        matcha_testing_directory (str): The path to the matcha testing directory.
+        base_template (BaseTemplate): The BaseTemplate object being tested.
+        unavailable (Tuple[str, ...]): names of the os functions which should fail.
+        failure (Dict[str, Any]): how the os functions fail, either raising an error or returning 0.
+    """
+    contents = os.urandom(2 * 1024 * 1024 + 3)
+    test_file_path = os.path.join(tmp_path, "test_file_1.tf")
+    with open(test_file_path, "wb") as f:
+        f.write(contents)
+
+    patches = [mock.patch(f"os.{name}", create=True, **failure) for name in unavailable]
+    for patch in patches:
+        patch.start()
+    try:
+        base_template.copy_files([test_file_path], matcha_testing_directory)
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    with open(os.path.join(matcha_testing_directory, "test_file_1.tf"), "rb") as f:
+        assert f.read() == contents
+
+
+def test_leaf_directories():
+    """Test that parent directories are removed when a nested directory is also present."""
+    directory_names = [
+        "zen_server",
+        "aks",
+        "zen_server/zenml_helm",
+        "zen_server/zenml_helm/templates",
+        "zen_server_extra",
+        "aks",
+    ]
+
+    assert sorted(_leaf_directories(directory_names)) == [
+        "aks",
+        "zen_server/zenml_helm/templates",
+        "zen_server_extra",
+    ]
+
+
+def test_build_template_overrides_existing_template(
+    matcha_testing_directory: str,
+    mock_infrastructure_directory: Tuple[str, str, str, str],
+    base_template: BaseTemplate,
+):
+    """Test that rebuilding a template overwrites template files and removes any stale files.
+
+    Args:
+        matcha_testing_directory (str): Temporary .matcha directory path
+        mock_infrastructure_directory (Tuple[str, str, str, str]): mock infrastructure directory structure
+        base_template (BaseTemplate): base template object
+    """
+    _, template_src_path, submodule_1_dir, _ = mock_infrastructure_directory
+    config = TemplateVariables(location="test-location", prefix="test-prefix")
+    destination_path = os.path.join(
+        matcha_testing_directory, "infrastructure", "test_resource"
+    )
+
+    base_template.build_template(config, template_src_path, destination_path)
+
+    stale_directory = os.path.join(destination_path, ".terraform", "providers")
+    os.makedirs(stale_directory)
+    stale_files = [
+        os.path.join(stale_directory, "provider"),
+        os.path.join(destination_path, "test_submodule_1", "removed.tf"),
+    ]
+    for stale_file in stale_files:
+        with open(stale_file, "w"):
+            ...
+
+    # Terraform links providers from a plugin cache outside of the template
+    plugin_cache = os.path.join(matcha_testing_directory, "plugin_cache")
+    os.makedirs(plugin_cache)
+    cached_provider = os.path.join(plugin_cache, "provider")
+    with open(cached_provider, "w"):
+        ...
+    stale_links = [
+        os.path.join(stale_directory, "linked_provider"),
+        os.path.join(destination_path, "test_submodule_1", "linked_provider"),
+    ]
+    for stale_link in stale_links:
+        os.symlink(plugin_cache, stale_link, target_is_directory=True)
+
+    with open(os.path.join(submodule_1_dir, "test_file_1.tf"), "w") as f:
+        f.write("updated")
+
+    base_template.build_template(config, template_src_path, destination_path)
+
+    for stale_file in stale_files:
+        assert not os.path.exists(stale_file)
+    for stale_link in stale_links:
+        assert not os.path.lexists(stale_link)
+    assert not os.path.exists(os.path.join(destination_path, ".terraform"))
+    assert os.path.exists(cached_provider)
+
+    with open(
+        os.path.join(destination_path, "test_submodule_1", "test_file_1.tf")
+    ) as f:
+        assert f.read() == "updated"
+
+    expected_tf_vars = {"location": "test-location", "prefix": "test-prefix"}
+    assert_infrastructure(template_src_path, destination_path, expected_tf_vars)
+
+
+def test_copy_files_skips_unchanged_files(
+    tmp_path: str, matcha_testing_directory: str, base_template: BaseTemplate
+):
+    """Test that copy_files only copies a file again when its size or modification time changes.
+
+    Args:
+        tmp_path (str): The temporary directory path provided by pytest.
+        matcha_testing_directory (str): The path to the matcha testing directory.
+        base_template (BaseTemplate): The BaseTemplate object being tested.
+    """
+    test_file_path = os.path.join(tmp_path, "test_file_1.tf")
+    with open(test_file_path, "w") as f:
+        f.write("source")
+
+    (copied_file_path,) = base_template.copy_files(
+        [test_file_path], matcha_testing_directory
+    )
+    source_stat = os.stat(test_file_path)
+    assert os.stat(copied_file_path).st_mtime_ns == source_stat.st_mtime_ns
+
+    # Change the copy without changing its size or modification time
+    with open(copied_file_path, "w") as f:
+        f.write("edited")
+    os.utime(copied_file_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+    base_template.copy_files([test_file_path], matcha_testing_directory)
+    with open(copied_file_path) as f:
+        assert f.read() == "edited"
+
+    # Changing the source modification time copies the file again
+    os.utime(
+        test_file_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 10**9)
+    )
+
+    base_template.copy_files([test_file_path], matcha_testing_directory)
+    with open(copied_file_path) as f:
+        assert f.read() == "source"
+
+
+@pytest.mark.parametrize("destination", [".", "./", "output/../output", "output"])
+def test_build_template_relative_destination(
+    mock_infrastructure_directory: Tuple[str, str, str, str],
+    base_template: BaseTemplate,
+    destination: str,
+):
+    """Test that a template built into a relative destination keeps every file it wrote.
+
+    Args:
+        mock_infrastructure_directory (Tuple[str, str, str, str]): mock infrastructure directory structure
+        base_template (BaseTemplate): base template object
+        destination (str): the relative destination path to build the template in
+    """
+    infrastructure_dir, template_src_path, _, _ = mock_infrastructure_directory
+    build_directory = os.path.join(infrastructure_dir, "build")
+    os.makedirs(os.path.join(build_directory, "output"))
+    os.chdir(build_directory)
+
+    config = TemplateVariables(location="test-location", prefix="test-prefix")
+    base_template.build_template(config, template_src_path, destination)
+
+    expected_tf_vars = {"location": "test-location", "prefix": "test-prefix"}
+    assert_infrastructure(template_src_path, destination, expected_tf_vars)
+    for filename in base_template.main_module_filenames:
+        assert os.path.exists(os.path.join(destination, filename))
+    assert os.path.exists(
+        os.path.join(destination, "test_submodule_2", "test_file_2.yaml")
+    )